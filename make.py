@@ -9,7 +9,7 @@ Low-dependency build script.
 # - More reliable code (less API to break)
 from __future__ import annotations
 
-import subprocess
+import os
 import sys
 
 
@@ -29,25 +29,31 @@ def command(f) -> None:
 @command
 def test(**_) -> None:
     """Run pytest."""
-    subprocess.run(['pytest', 'tests'])
+    os.execvp('pytest', ['pytest', 'tests'])
 
 
 @command
 def typecheck(**_) -> None:
     """Type-check with pyright."""
-    subprocess.run(['pyright', 'obsidian_runny'])
+    os.execvp('pyright', ['pyright', 'obsidian_runny'])
 
 
 @command
 def help(print_func=print, **_) -> None:
     """Print usage information."""
 
-    command_width = max(len(k) for k in commands)
     print_func(__doc__.strip(), end="\n\n")
-    for name, func in commands.items():
-        print_func(f"{sys.argv[0]} {name:<{command_width}}", end="      ")
-        doc = getattr(func, '__doc__', '[ no docstring ]')
-        print_func(doc.split("\n")[0])
+    for name, summary in _HELP_LINES:
+        print_func(f"{sys.argv[0]} {name:<{_COMMAND_WIDTH}}", end="      ")
+        print_func(summary)
+
+
+# All commands are registered above, so these can't go stale
+_COMMAND_WIDTH = max(len(k) for k in commands)
+_HELP_LINES = [
+    (name, (func.__doc__ or '[ no docstring ]').split("\n", 1)[0])
+    for name, func in commands.items()
+]
 
 
 def main():
@@ -65,7 +71,7 @@ def main():
 
     run_command = commands.get(command_name)
     run_command(**kwargs)
-    exit(problem)
+    sys.exit(problem)
 
 
 if __name__ == '__main__':
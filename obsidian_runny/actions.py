@@ -0,0 +1,32 @@
+"""Built-in Obsidian URI actions.
+
+See the Obsidian documentation for more info:
+https://help.obsidian.md/Extending+Obsidian/Obsidian+URI
+"""
+from typing import Final
+
+
+class _URIAction:
+    """Covers built-in Obsidian URI actions.
+
+    It is `_underscore_protected` since plugins *may*
+    add new new actions:
+
+    * The first-party Daily plugin is an example
+    * Third-party plugins may also add new ones
+
+    The values are plain `str` constants rather than enum
+    members since they are only ever used as URI text.
+    """
+
+    OPEN: Final = "open"
+    """Open an existing note."""
+
+    NEW: Final = "new"
+    """New command."""
+
+    SEARCH: Final = "search"
+    """Search notes."""
+
+    DAILY: Final = "daily"
+    """Requires the Daily plugin to be enabled."""
@@ -4,15 +4,8 @@
 
 This module must be usable at any time without circular imports.
 """
-from collections.abc import Iterable, Mapping
-from typing_extensions import (
-    Callable,
-    Generic,
-    Hashable,
-    ParamSpec,
-    Protocol,
-    TypeVar
-)
+from collections.abc import Callable, Hashable, Iterable, Mapping
+from typing import Generic, ParamSpec, Protocol, TypeVar
 
 __all__ = [
     'PairFormatter',
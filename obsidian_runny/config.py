@@ -1,6 +1,11 @@
 import logging
 
 
+# Snapshot at import: levels registered later via addLevelName won't appear
+_LEVEL_NAMES = logging.getLevelNamesMapping()
+_KNOWN_LEVELS_REPR = ", ".join(repr(level) for level in _LEVEL_NAMES)
+
+
 class LogLevel(str):
     """Convert to upper case and validate as a known name.
 
@@ -11,15 +16,11 @@ class LogLevel(str):
 
     def __new__(cls, level_raw: str):
         level_upper = level_raw.upper()
-        _mapping = logging.getLevelNamesMapping()
-        level_int = _mapping.get(level_upper, None)
+        level_int = _LEVEL_NAMES.get(level_upper, None)
         if level_int is None:
-            known_levels = ", ".join((
-                repr(level) for level in _mapping.keys()
-            ))
             raise ValueError(
                 f"Invalid log level: {level_raw!r}."
-                f" Expected one of: {known_levels}"
+                f" Expected one of: {_KNOWN_LEVELS_REPR}"
             )
         instance = super().__new__(cls, level_upper)
         setattr(instance, '_level_int', level_int)
@@ -38,6 +38,6 @@ def iter_as_pairs(iterable: DictArgsLike[K, V]) -> Generator[tuple[K, V], None,
     if isinstance(iterable, Mapping):
         yield from iterable.items()  # type: ignore
     else:
-        for pair in iterable:
-            k, v = pair
-            yield k, v  # type: ignore
\ No newline at end of file
+        # Unpacking in the loop target length-checks each pair in C
+        for k, v in iterable:  # type: ignore
+            yield k, v
\ No newline at end of file
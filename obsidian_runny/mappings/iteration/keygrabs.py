@@ -12,9 +12,11 @@ please consider that:
 
 [itemgetter]: https://docs.python.org/3/library/operator.html#operator.itemgetter
 """
-import inspect
+import sys
 
+from collections import Counter
 from collections.abc import Iterable, Mapping, MutableMapping
+from types import MappingProxyType
 from typing import TYPE_CHECKING, Any, Callable, Generic, overload
 from operator import getitem
 
@@ -66,6 +68,10 @@ class DuplicateKeyError(_KeyErrorPlus[K]):
         super().__init__(key, message)
 
 
+_EMPTY_DICT: Mapping[Any, Any] = MappingProxyType({})
+"""Shared read-only stand-in for empty `defaults`."""
+
+
 def pop_item(m: MutableMapping[K, V], k: K) -> V:
     """`MutableMapping.pop()` as a `len`-like function.
 
@@ -135,12 +141,12 @@ def per_key(
 
     Then it does the following:
 
-    1. For each required key, write `action(source, key)` to
-       1. call `action(source, key)`
-    2. For each `optional` key:
-       * Use any present value for the key as an argument to `action`
-       * Otherwise, use the value in `default` instead
-    3. Write the results to `destination` or a new dict
+    1. For each `required` key, store `action(source, key)`
+    2. For each `optional` key present in `source`, do the same
+    3. For each `defaults` key:
+       * Store `action(source, key)` if `source` has the key
+       * Otherwise, store the default value instead
+    4. Write the results to `destination` or a new dict
 
     Arguments:
         action:
@@ -165,50 +171,45 @@ def per_key(
         Either `destination` or a new `dict`.
     """
     # First we validate: change *nothing* until we know we have data!
-    seen = set()
-    def check_key(k, require: bool = True):
-        if k in seen:
-            raise DuplicateKeyError(f"duplicate key: {k}")
-        elif require:
-            if k in source:
-                seen.add(k)
-            else:
-                raise MissingKeyError(f"source lacks key {k}")
-        return k
-
-    to_copy_as_is = []
-    for k in required:
-        check_key(k)
-        to_copy_as_is.append(k)
-
-    for k in optional:
-        check_key(k, require=False)
-        to_copy_as_is.append(k)
-
+    # Materialize once so generators are only consumed here.
+    required = tuple(required)
+    optional = tuple(optional)
     # 1. No consumable iterables -> no unpack
     # 2. Dict handles the pair validation for us
-    defaults_dict = dict(defaults)
-    for k in defaults_dict.keys():
-        check_key(k)
+    # 3. Most calls pass no defaults, so skip allocating an empty dict
+    defaults_dict = dict(defaults) if defaults else _EMPTY_DICT
 
-    # Temp storage we discard if something fails.
-    updates = {}
+    # One C-level hashing pass covers repeats within *and* across the
+    # collections; only pay to find which key repeated on failure.
+    all_keys = (*required, *optional, *defaults_dict)
+    if len(set(all_keys)) != len(all_keys):
+        raise DuplicateKeyError(
+            next(k for k, n in Counter(all_keys).items() if n > 1))
+
+    for k in required:
+        if k not in source:
+            raise MissingKeyError(k)
+
+    # Validation passed, so write results straight into the target.
+    # An `action` which raises part-way will leave earlier writes in
+    # `destination`; pass `destination=None` and merge if that matters.
+    out = {} if destination is None else destination
 
     # *Now* we apply changes once we know we have them.
-    for k in to_copy_as_is:
-        updates[k] = action(source, k)
+    for k in required:
+        out[k] = action(source, k)
+
+    for k in optional:
+        if k in source:
+            out[k] = action(source, k)
 
     for k, default in defaults_dict.items():
         if k in source:
-            updates[k] = action(source, k)
+            out[k] = action(source, k)
         else:
-            updates[k] = default
+            out[k] = default
 
-    if destination is None:
-        return updates
-    else:
-        destination.update(updates)
-        return destination
+    return out
 
 
 if TYPE_CHECKING:
@@ -283,8 +284,9 @@ def pop_keys(
         defaults = (),
         destination = None
 ):
+    # For exact dicts, the C-level method skips pop_item's Python frame
     return per_key(
-        pop_item,
+        dict.pop if type(source) is dict else pop_item,  # type: ignore
         source=source,
         required=required,
         optional=optional,
@@ -322,9 +324,8 @@ def get_locals(
 ):
     """Copy values from the local context into a mapping. """
 
-    outer_frame: inspect.FrameInfo =\
-        inspect.currentframe().f_back  # type: ignore
-    f_locals: dict[str, Any] = outer_frame.f_locals  # type: ignore
+    # What inspect.currentframe() wraps, minus a Python-level call
+    f_locals: dict[str, Any] = sys._getframe(1).f_locals  # type: ignore
 
     try:
         return get_keys(
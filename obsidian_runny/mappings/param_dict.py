@@ -1,11 +1,9 @@
 """Helper containers and related functions."""
 from collections.abc import Iterable, Mapping, Sequence
 import inspect
-from typing import Generator
+from typing import Self
 from obsidian_runny.annotations import K, V, DictArgsLike
 
-from typing_extensions import Self
-
 from obsidian_runny.mappings.iteration import iter_as_pairs
 from obsidian_runny.mappings.iteration.keygrabs import get_keys
 
@@ -17,20 +15,22 @@ __all__ = [
 def _as_dict_args(
         args: Sequence[DictArgsLike[str, V]],
         kwargs: DictArgsLike[str, V]
-) -> Generator[tuple[str, V], None, None]:
-        copy_from: DictArgsLike[str, V] = ()
-        if not isinstance(kwargs, Mapping):
-            kwargs = dict(kwargs)
-        match bool(len(args)), bool(len(kwargs)):
-            case True, True:
-                raise TypeError("Expects only 1 arg or kwarg values")
-            case False, True:
-                copy_from = kwargs
-            case True, False:
-                copy_from = args[0] # type: ignore
-            case _, _:
-                pass
-        yield from iter_as_pairs(copy_from)
+) -> Iterable[tuple[str, V]]:
+    """Pick the `(k, v)` pairs to copy from `dict()`-style arguments.
+
+    A plain function rather than a generator: mappings hand back
+    their C-level `.items()` view instead of paying for a frame.
+    """
+    if not isinstance(kwargs, Mapping):
+        kwargs = dict(kwargs)
+    if kwargs:
+        if args:
+            raise TypeError("Expects only 1 arg or kwarg values")
+        return kwargs.items()  # type: ignore
+    if args:
+        src = args[0]
+        return src.items() if isinstance(src, Mapping) else iter_as_pairs(src)  # type: ignore
+    return ()
 
 
 class ParamDict(dict[str, V]):
@@ -44,13 +44,33 @@ class ParamDict(dict[str, V]):
     2. Setting an instance's key to `None` deletes it
     """
 
+    __slots__ = ()
+
     def __init__(
         self,
         *args: DictArgsLike[str, V],
         **kwargs: V
     ):
-        super().__init__()
-        self._update_core(args, kwargs)
+        if not args:
+            self._bulk_set_no_none(kwargs.items())
+        elif len(args) == 1 and not kwargs and type(args[0]) is dict:
+            # One C-level copy, then drop the (usually few) None values
+            dict.__init__(self, args[0])
+            for k in [k for k, v in self.items() if v is None]:
+                dict.__delitem__(self, k)
+        else:
+            self._update_core(args, kwargs)
+
+    def _bulk_set_no_none(self, pairs: Iterable[tuple[str, V | None]]) -> None:
+        """Store all pairs with non-`None` values.
+
+        `None` is filtered here, so this skips our `__setitem__`
+        and its checks by calling `dict.__setitem__` directly.
+        """
+        _set = dict.__setitem__
+        for k, v in pairs:
+            if v is not None:
+                _set(self, k, v)
 
     def _update_core(
             self,
@@ -58,10 +78,7 @@ class ParamDict(dict[str, V]):
             kwargs: DictArgsLike[str, V] = ()
     ) -> None:
         """Avoid unpack/repack."""
-        for k, v in _as_dict_args(args, kwargs):
-            if v is None:
-                continue
-            self[k] = v
+        self._bulk_set_no_none(_as_dict_args(args, kwargs))
 
     def update(self, *args, **kwargs) -> None:
         self._update_core(args, kwargs)
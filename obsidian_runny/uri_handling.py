@@ -14,24 +14,19 @@ See the docstrings below to learn more, or file an issue
 if you would like support for another approach.
 
 """
-import platform
-import subprocess
 import logging
+import sys
 
+from collections.abc import Callable, Mapping
 from dataclasses import dataclass
+from functools import cache, lru_cache
+from typing import Any, Final, Protocol
 from urllib.parse import quote as urlquote
 from obsidian_runny.annotations import (
     V,
     ParamsFormatter
 )
 
-from typing_extensions import (
-    Any,
-    Final,
-    Mapping,
-    Protocol,
-)
-
 from obsidian_runny.mappings.param_dict import ParamDict
 
 
@@ -50,27 +45,44 @@ __all__ = [
     "XDGMimeURIOpener"
 ]
 
-log = logging.getLogger()
+log = logging.getLogger(__name__)
 
 
-_keys_are_bool = set((
+_keys_are_bool: Final[frozenset[str]] = frozenset((
     "clipboard",
     "silent",
     "overwrite"
 ))
 _bool2str = {True: "true", False: "false"}
 
-def format_param_pair(k: str, v: Any) -> str:
-    parts = [urlquote(k)]
+# Vault names, paths, and keys tend to repeat between calls
+_quote = lru_cache(maxsize=128)(urlquote)
+
+def _encode_bool(k: str, v: Any) -> str:
+    if v not in _bool2str:
+        raise TypeError(f"Expected bool value for {k}, not {v!r}")
+    return _bool2str[v]
 
-    if k in _keys_are_bool:
-        if v not in _bool2str:
-            raise TypeError(f"Expected bool value for {k}, not {v!r}")
-        parts.append(_bool2str[v]) # type: ignore
-    else:
-        parts.append(urlquote(str(v)))
 
-    return "=".join(parts)
+def _encode_str(k: str, v: Any) -> str:
+    return _quote(str(v))
+
+
+_ENCODER: Final[dict[str, Callable[[str, Any], str]]] = dict.fromkeys(
+    _keys_are_bool, _encode_bool)
+"""Per-key value encoders; keys not listed use `_encode_str`."""
+
+
+def format_param_pair(
+    k: str,
+    v: Any,
+    *,
+    # Bound at definition time so the per-pair loop uses fast locals
+    _get_encoder: Callable[..., Callable[[str, Any], str]] = _ENCODER.get,
+    _default: Callable[[str, Any], str] = _encode_str,
+    _q: Callable[[str], str] = _quote,
+) -> str:
+    return f"{_q(k)}={_get_encoder(k, _default)(k, v)}"
 
 
 def format_parameters(parameters: Mapping[str, Any]) -> str:
@@ -79,15 +91,15 @@ def format_parameters(parameters: Mapping[str, Any]) -> str:
     Args:
         parameters: A mapping to format.
     """
-    params_quoted = []
-
-    for raw_key, raw_value in parameters.items():
-        if not isinstance(raw_key, str):
-            raise TypeError(f"{raw_key!r} is not a str")
-        encoded = format_param_pair(raw_key, raw_value)
-        params_quoted.append(encoded)
+    # Like assert statements, python -O strips these checks
+    if __debug__:
+        for raw_key in parameters:
+            if not isinstance(raw_key, str):
+                raise TypeError(f"{raw_key!r} is not a str")
 
-    return "&".join(params_quoted)
+    return "&".join([
+        format_param_pair(k, v) for k, v in parameters.items()
+    ])
 
 
 def format_uri(
@@ -98,19 +110,16 @@ def format_uri(
 ) -> str:
     """Good-enough stub since urllib seems crufy and complicated."""
 
-    if not isinstance(protocol, str):
-        raise TypeError("expected string for protocol")
-    if not isinstance(resource, str):
-        raise TypeError("expected string for resource")
+    if __debug__:
+        if not isinstance(protocol, str):
+            raise TypeError("expected string for protocol")
+        if not isinstance(resource, str):
+            raise TypeError("expected string for resource")
 
-    parts = [protocol, "://", urlquote(resource)]
+    quoted_resource = _quote(resource)
     if parameters:
-        parts.extend((
-            "?",
-            params_formatter(parameters)
-        ))
-
-    return "".join(parts)
+        return f"{protocol}://{quoted_resource}?{params_formatter(parameters)}"
+    return f"{protocol}://{quoted_resource}"
 
 
 class PlatformURIOpener(Protocol):
@@ -128,22 +137,23 @@ class PlatformURIOpener(Protocol):
         return
 
     def _run_cmd(self, parts: list[str], **kwargs) -> None:
-        cmd = " ".join(parts)
-        print(cmd, kwargs)
-        subprocess.run(" ".join(parts), **kwargs)
+        import subprocess
+        log.debug("running %r with %r", parts, kwargs)
+        # An argv list needs no shell or quoting and can't be injected into
+        process = subprocess.Popen(parts, close_fds=True, **kwargs)
+        # The openers hand off to the app and exit; wait to reap them
+        process.wait()
 
     def __call__(self, uri: str) -> None:
         parts = []
         self._pre_uri(parts)
-        parts.append(f"\"{uri}\"")
+        parts.append(uri)
         self._post_uri(parts)
         self._run_cmd(parts)
 
 
 class PosixLikeURIOpener(PlatformURIOpener):
-
-    def _run_cmd(self, parts: list[str], shell: bool = True, **kwargs):
-        super()._run_cmd(parts, shell=shell, **kwargs)
+    """Base class for openers on POSIX-like systems."""
 
 
 @dataclass(frozen=True)
@@ -165,51 +175,69 @@ class XDGMimeURIOpener(PosixLikeURIOpener):
     """Whether the process should die after current user logout"""
 
     def _pre_uri(self, parts: list[str]) -> None:
-        if not self.hup:
-            parts.append("nohup")
         parts.append("xdg-open")
 
-    def _post_uri(self, parts: list[str]) -> None:
+    def _run_cmd(self, parts: list[str], **kwargs) -> None:
+        import subprocess
         if not self.log:
-            parts.append(POSIX_REDIRECT_OUTPUT_TO_NULL)
+            kwargs.setdefault("stdout", subprocess.DEVNULL)
+            kwargs.setdefault("stderr", subprocess.DEVNULL)
+        # A new session is what nohup provided: no SIGHUP on logout
+        kwargs.setdefault("start_new_session", not self.hup)
+        super()._run_cmd(parts, **kwargs)
 
 
 class WindowsURIOpener(PlatformURIOpener):
-    """Powershell-based opener"""
+    """Opens URIs through the Windows URL protocol handler.
+
+    `start` is a shell built-in, so this uses `rundll32` to
+    avoid needing `cmd.exe` to parse the URI's `&` characters.
+    """
 
     def _pre_uri(self, parts: list[str]) -> None:
-        parts.append("Start")
+        parts.extend(("rundll32", "url.dll,FileProtocolHandler"))
 
 
 class MacURIOpener(PlatformURIOpener):
     """Mac opener"""
 
     def _pre_uri(self, parts: list[str]) -> None:
-        parts.append("open -gja")
+        # -g: don't bring the app to the foreground
+        parts.extend(("open", "-g"))
 
 
 platform_uri_opener: PlatformURIOpener
+"""Detected on first access (see `__getattr__` below).
+
+Assign an opener to this to override the detected one.
+"""
+
 
-match (_plat_name := platform.system()):
-    case "Windows":
-        platform_uri_opener = WindowsURIOpener()
-    case "Mac":
-        platform_uri_opener = MacURIOpener()
-
-    # Linux and BSD-likes (hope for XDG, then fail if not found)
-    case _:
-        try:
-            subprocess.run(
-                f"xdg-open --help {POSIX_REDIRECT_OUTPUT_TO_NULL}",
-                check=True,
-                shell=True
-            )
-            platform_uri_opener = XDGMimeURIOpener()
-        except subprocess.CalledProcessError as e:
-            raise NotImplementedError(
-                f"{_plat_name} (assumed POSIX-like) has no xdg-open.\n"
-                f"Please file an issue https://github.com/pushfoo/obsidian-runny/issues/new"
-            )
+@cache
+def _detect_opener() -> PlatformURIOpener:
+    """Detect the opener for this platform once, then reuse it.
+
+    Deferring this keeps the xdg-open probe out of import time.
+    """
+    # sys.platform avoids importing the platform module
+    match sys.platform:
+        case "win32":
+            opener: PlatformURIOpener = WindowsURIOpener()
+        case "darwin":
+            opener = MacURIOpener()
+
+        # Linux and BSD-likes (hope for XDG, then fail if not found)
+        case _:
+            import shutil
+            # A PATH lookup instead of spawning a shell to run xdg-open
+            if shutil.which("xdg-open") is None:
+                raise NotImplementedError(
+                    f"{sys.platform} (assumed POSIX-like) has no xdg-open.\n"
+                    f"Please file an issue https://github.com/pushfoo/obsidian-runny/issues/new"
+                )
+            opener = XDGMimeURIOpener()
+
+    return opener
 
 
 def run_obsidian_uri_command(
@@ -225,11 +253,29 @@ def run_obsidian_uri_command(
     ```
     obsidian://new?vault=Obsidian%20Vault&file=New%20Note%20In%Root
     ```
+
+    Arguments:
+        action:
+            The URI action, used as-is. It is not checked against
+            the built-in actions since plugins may add their own.
+        parameters:
+            The query parameters for the action.
     """
     uri = format_uri(
         protocol="obsidian",
         resource=action,
         parameters=ParamDict.as_instance(parameters)
     )
-    log.info(f"uri: {uri}")
-    platform_uri_opener(uri)
+    log.info("uri: %s", uri)
+    # An assigned platform_uri_opener lives in globals; else detect one
+    opener = globals().get("platform_uri_opener")
+    if opener is None:
+        opener = _detect_opener()
+    opener(uri)
+
+
+def __getattr__(name: str) -> Any:
+    # PEP 562: keep `platform_uri_opener` public without probing at import
+    if name == "platform_uri_opener":
+        return _detect_opener()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
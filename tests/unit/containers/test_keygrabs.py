@@ -1,10 +1,15 @@
+from collections import UserDict
+
 import pytest
 
 from obsidian_runny.mappings.iteration import (
     # per_key,
     pop_item,
-    # get_keys,
-    # pop_keys,
+    get_keys,
+    get_locals,
+    MissingKeyError,
+    DuplicateKeyError,
+    pop_keys,
 )
 
 
@@ -31,6 +36,46 @@ def test_pop_item_key_error_on_missing():
     with pytest.raises(KeyError):
         pop_item({}, "a")
 
+def test_get_keys_skips_absent_optional_keys():
+    d = dict(a=1, b=2)
+    assert get_keys(d, required=('a',), optional=('b', 'c')) == d
+
+
+def test_get_keys_uses_default_only_when_absent():
+    d = dict(a=1)
+    assert get_keys(d, defaults=dict(a=0, b=0)) == dict(a=1, b=0)
+
+
+def test_get_keys_raises_on_missing_required():
+    with pytest.raises(MissingKeyError) as e:
+        get_keys(dict(a=1), required=('a', 'b'))
+    assert e.value.key == 'b'
+
+
+@pytest.mark.parametrize("kwargs", [
+    dict(required=('a', 'a')),
+    dict(required=('a',), optional=('a',)),
+    dict(optional=('a',), defaults=dict(a=0)),
+])
+def test_get_keys_raises_on_duplicate_keys(kwargs):
+    with pytest.raises(DuplicateKeyError) as e:
+        get_keys(dict(a=1), **kwargs)
+    assert e.value.key == 'a'
+
+
+@pytest.mark.parametrize("source_type", (dict, UserDict))
+def test_pop_keys_pops_values_from_source(source_type):
+    source = source_type(a=1, b=2)
+    assert pop_keys(source, required=('a',), optional=('b', 'c')) == dict(a=1, b=2)
+    assert len(source) == 0
+
+
+def test_get_locals_raises_name_error_for_missing_variable():
+    a = 1  # read through the frame by get_locals
+    with pytest.raises(NameError, match="^b$"):
+        get_locals(required=('a', 'b'))
+
+
 # Further tests pending review (i.e. "Is this idea silly?" / YAGNI)
 #
 # @pytest.fixture(params=(
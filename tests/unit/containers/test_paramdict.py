@@ -14,6 +14,11 @@ def test_init_only_removes_none_keys(p):
     assert p['e'] is True
 
 
+def test_init_kwargs_only_removes_none_keys():
+    p = ParamDict(a=None, b=1, d=False)
+    assert p == dict(b=1, d=False)
+
+
 def test_init_raises_typeerror_when_both_args_and_kwargs():
     with pytest.raises(TypeError):
         _ = ParamDict([], key=1)
@@ -0,0 +1,97 @@
+import subprocess
+from unittest.mock import MagicMock
+
+import pytest
+
+from obsidian_runny import uri_handling
+from obsidian_runny.uri_handling import (
+    format_parameters,
+    format_uri,
+    MacURIOpener,
+    run_obsidian_uri_command,
+    WindowsURIOpener,
+    XDGMimeURIOpener,
+)
+
+
+URI = "obsidian://open?vault=My%20Vault&file=a%26b"
+
+
+@pytest.fixture
+def popen(monkeypatch):
+    mock = MagicMock()
+    monkeypatch.setattr(subprocess, "Popen", mock)
+    return mock
+
+
+@pytest.mark.parametrize("value,expected", (
+    (True, "true"),
+    (False, "false"),
+))
+def test_format_parameters_bool_keys(value, expected):
+    assert format_parameters(dict(silent=value)) == f"silent={expected}"
+
+
+def test_format_parameters_type_error_on_non_bool_for_bool_key():
+    with pytest.raises(TypeError):
+        format_parameters(dict(overwrite="yes"))
+
+
+def test_format_parameters_type_error_on_non_str_key():
+    with pytest.raises(TypeError):
+        format_parameters({1: "a"})
+
+
+def test_format_parameters_quotes_keys_and_values():
+    assert format_parameters(
+        {"a key": "a value&more", "vault": "My Vault"}
+    ) == "a%20key=a%20value%26more&vault=My%20Vault"
+
+
+def test_format_uri_quotes_resource_and_parameters():
+    assert format_uri(
+        "obsidian", "new note", dict(name="a/b c", silent=True)
+    ) == "obsidian://new%20note?name=a/b%20c&silent=true"
+
+
+def test_format_uri_without_parameters():
+    assert format_uri("obsidian", "open", {}) == "obsidian://open"
+
+
+@pytest.mark.parametrize("hup", (True, False))
+def test_xdg_opener_runs_argv_without_shell(popen, hup):
+    XDGMimeURIOpener(hup=hup)(URI)
+    popen.assert_called_once_with(
+        ["xdg-open", URI],
+        close_fds=True,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+        start_new_session=not hup,
+    )
+    popen.return_value.wait.assert_called_once_with()
+
+
+def test_xdg_opener_keeps_output_when_logging(popen):
+    XDGMimeURIOpener(log=True)(URI)
+    kwargs = popen.call_args.kwargs
+    assert "stdout" not in kwargs
+    assert "stderr" not in kwargs
+
+
+def test_windows_opener_argv(popen):
+    WindowsURIOpener()(URI)
+    popen.assert_called_once_with(
+        ["rundll32", "url.dll,FileProtocolHandler", URI], close_fds=True)
+
+
+def test_mac_opener_argv(popen):
+    MacURIOpener()(URI)
+    popen.assert_called_once_with(["open", "-g", URI], close_fds=True)
+
+
+def test_run_command_uses_assigned_platform_uri_opener(monkeypatch):
+    opener = MagicMock()
+    # setitem, since getattr on the module would run opener detection
+    monkeypatch.setitem(vars(uri_handling), "platform_uri_opener", opener)
+    run_obsidian_uri_command("open", dict(vault="My Vault"))
+    opener.assert_called_once_with("obsidian://open?vault=My%20Vault")